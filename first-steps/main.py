@@ -1,11 +1,26 @@
-from fastapi import FastAPI, Query, Body, HTTPException, Path
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import List, Optional, Union, Literal
-from math import ceil
-
-app = FastAPI(title="Mini Blog")
-
-BLOG_POST = [
+from fastapi import FastAPI, Query, Body, Path, Request, Response
+from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.openapi.docs import (get_redoc_html, get_swagger_ui_html,
+                                  get_swagger_ui_oauth2_redirect_html)
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, field_validator
+from typing import Any, Dict, List, Optional, Union, Literal
+from functools import lru_cache
+from itertools import islice
+from bisect import bisect_left, insort
+import re
+import json
+import hashlib
+from uuid import uuid4
+
+
+OPENAPI_URL = "/openapi.json"
+
+# Las rutas de OpenAPI y de la documentacion se registran a mano (ver abajo)
+# para servir el esquema ya serializado en lugar de codificarlo en cada request
+app = FastAPI(title="Mini Blog", openapi_url=None, docs_url=None, redoc_url=None)
+
+# Posts indexados por id; el dict conserva el orden de insercion para la paginacion
+BLOG_POST = {post["id"]: post for post in [
     {"id": 1, "title": "Primero Post",
         "content": "Este es mi primer post en FastAPI."},
     {"id": 2, "title": "Segundo Post", "content": "Aprendiendo FastAPI es divertido!"},
@@ -33,13 +48,142 @@ BLOG_POST = [
         "content": "Optimización de rendimiento."},
     {"id": 20, "title": "Veinteavo Post",
         "content": "Comunidad y recursos de FastAPI."}
-]
+]}
+
+# Titulos en minusculas por id, paralelos a BLOG_POST (mismo orden de insercion)
+# La busqueda por id recorre solo estos strings sin tocar el dict de cada post
+TITLES_LOWER = {post_id: post["title"].lower() for post_id, post in BLOG_POST.items()}
+
+
+def _title_key(post: dict) -> tuple:
+    # El id desempata titulos iguales para que el orden sea estable
+    return post["title"], post["id"]
+
+
+# Posts ordenados por titulo; se mantiene al crear/actualizar/borrar para
+# que get_posts no tenga que ordenar en cada request
+TITLE_INDEX = sorted(BLOG_POST.values(), key=_title_key)
+
+
+def index_title(post: dict) -> None:
+    insort(TITLE_INDEX, post, key=_title_key)
+
+
+def unindex_title(post: dict) -> None:
+    # Debe llamarse antes de modificar el titulo del post
+    del TITLE_INDEX[bisect_left(TITLE_INDEX, _title_key(post), key=_title_key)]
+
+
+# Permite caracteres alfanumericos, espacios, signos de puntuacion y simbolos
+# Se define una sola vez; pydantic-core compila el patron al registrar la ruta
+SEARCH_PATTERN = r"^[\w\s\p{P}\p{S}]+$"
+
+# Parametros de ruta y de consulta definidos una sola vez a nivel de modulo
+# para reutilizarlos en los endpoints que los necesiten
+SEARCH_QUERY = Query(
+    default=None,
+    title="Search Query",
+    description="Query to search blog posts",
+    alias="search",
+    min_length=3,
+    max_length=100,
+    pattern=SEARCH_PATTERN,
+)
+PER_PAGE_QUERY = Query(
+    default=10,
+    title="Posts per page",
+    description="Number of posts to retrieve",
+    ge=1,
+    le=50,
+)
+PAGE_QUERY = Query(
+    default=1,
+    title="Page",
+    description="Page number to retrieve",
+    ge=1,
+)
+ORDER_BY_QUERY = Query(
+    default="id",
+    title="Order By",
+    description="Field to order the posts by"
+)
+DIRECTION_QUERY = Query(
+    default="asc",
+    title="Direction",
+    description="Direction to order the posts by"
+)
+POST_ID_PATH = Path(
+    ...,
+    ge=1,
+    title="Post ID",
+    description="ID of the post to retrieve. Should be a positive integer.",
+)
+
+# Cuerpos constantes serializados una sola vez al importar el modulo
+HOME_BODY = json.dumps({"message": "Welcome to the Mini Blog!"},
+                       separators=(",", ":")).encode()
+NOT_FOUND_BODY = json.dumps({"detail": "Post not found"},
+                            separators=(",", ":")).encode()
+
+
+def not_found() -> Response:
+    # Mismo cuerpo que HTTPException(404, "Post not found") sin volver a serializarlo
+    return Response(content=NOT_FOUND_BODY, status_code=404, media_type="application/json")
+
+
+# Distinto en cada arranque: DATA_VERSION vuelve a 0 al reiniciar y sin este
+# token una version repetida podria validar datos distintos
+BOOT_TOKEN = uuid4().hex
+
+
+def make_etag(key: tuple) -> str:
+    # Cambia con cualquier mutacion (DATA_VERSION) y con los parametros del request
+    # blake2b da el mismo digest en todos los procesos, a diferencia de hash()
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    return f'W/"{BOOT_TOKEN}-{DATA_VERSION}-{digest}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    # If-None-Match usa comparacion debil: se ignora el prefijo W/
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    # If-None-Match puede traer varias etiquetas separadas por coma, o "*"
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(_opaque_tag(tag.strip()) == opaque for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    # El cliente ya tiene esta version: no se serializa ni se envia el cuerpo
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+# Se incrementa en cada create/update/delete para invalidar las cachés
+DATA_VERSION = 0
+
+# Siguiente id a asignar; no depende del ultimo post, asi que borrar el
+# ultimo no hace que su id se reutilice
+NEXT_ID = max(BLOG_POST, default=0) + 1
+
+# Maximo de posts por request en los endpoints por lote, igual que per_page
+# limita los listados: acota el trabajo que un solo request hace en el event loop
+MAX_BULK_SIZE = 50
 
 PROHIBITED_WORDS = [
     "spam", "tonto", "idiota", "basura", "malo",
     "estúpido", "inútil", "feo", "horrible"
 ]
 
+# Una sola expresion con todas las palabras: el motor de regex recorre el
+# titulo una vez en lugar de buscar cada palabra por separado
+PROHIBITED_PATTERN = re.compile("|".join(map(re.escape, PROHIBITED_WORDS)))
+
 
 class Tag(BaseModel):
     name: str = Field(..., min_length=2, max_length=30,
@@ -83,7 +227,7 @@ class PostCreate(BaseModel):
     @field_validator("title")
     @classmethod
     def not_allowed_title(cls, value: str) -> str:
-        if any(prohibited_word in value.lower() for prohibited_word in PROHIBITED_WORDS):
+        if PROHIBITED_PATTERN.search(value.lower()):
             raise ValueError(
                 f"The title cannot contain prohibited words: {', '.join(PROHIBITED_WORDS)}")
         return value
@@ -116,69 +260,120 @@ class PaginatedPost(BaseModel):
     items: List[PostPublic]
 
 
-# Root Endpoint
-@app.get("/")
-def home():
-    return {"message": "Welcome to the Mini Blog!"}
+# Adaptadores creados una sola vez: validan solo los items de la página
+# y serializan la respuesta directo a bytes JSON sin pasar por FastAPI
+POSTS_ADAPTER = TypeAdapter(List[PostPublic])
+PAGE_ADAPTER = TypeAdapter(PaginatedPost)
 
 
-# Query Parameter
-# Define como quiero traer el recurso
-@app.get("/posts", response_model=PaginatedPost)
-def get_posts(query: Optional[str] = Query(
-    default=None,
-    title="Search Query",
-    description="Query to search blog posts",
-    alias="search",
-    min_length=3,
-    max_length=100,
-    # Permite caracteres alfanumericos, espacios, signos de puntuacion y simbolos
-    pattern="^[\w\s\p{P}\p{S}]+$",
-),
-    per_page: int = Query(
-        default=10,
-        title="Posts per page",
-        description="Number of posts to retrieve",
-        ge=1,
-        le=50,
-),
-    page: int = Query(
-        default=1,
-        title="Page",
-        description="Page number to retrieve",
-        ge=1,
-),
-    order_by: Literal["id", "title"] = Query(
-        default="id",
-        title="Order By",
-        description="Field to order the posts by"
-),
-    direction: Literal["asc", "desc"] = Query(
-        default="asc",
-        title="Direction",
-        description="Direction to order the posts by"
-),
-):
+# Esquema OpenAPI serializado una sola vez por cada root_path; el root_path
+# lo fija el servidor o el proxy (p. ej. uvicorn --root-path /api)
+OPENAPI_BODIES: Dict[str, bytes] = {}
+
+
+def request_root_path(request: Request) -> str:
+    return request.scope.get("root_path", "").rstrip("/")
+
+
+@app.get(OPENAPI_URL, include_in_schema=False)
+async def openapi(request: Request):
+    root_path = request_root_path(request)
+    body = OPENAPI_BODIES.get(root_path)
+    if body is None:
+        schema = app.openapi()
+        # Igual que la ruta por defecto de FastAPI: detras de un prefijo se
+        # agrega como servidor para que "Try it out" use la URL correcta
+        if root_path and app.root_path_in_servers:
+            server_urls = {server.get("url") for server in schema.get("servers", [])}
+            if root_path not in server_urls:
+                schema = dict(schema)
+                schema["servers"] = [{"url": root_path}] + schema.get("servers", [])
+        body = OPENAPI_BODIES[root_path] = JSONResponse(schema).body
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui_html(request: Request) -> HTMLResponse:
+    root_path = request_root_path(request)
+    return get_swagger_ui_html(
+        openapi_url=root_path + OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=root_path + "/docs/oauth2-redirect",
+    )
+
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect() -> HTMLResponse:
+    return get_swagger_ui_oauth2_redirect_html()
+
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_html(request: Request) -> HTMLResponse:
+    return get_redoc_html(openapi_url=request_root_path(request) + OPENAPI_URL,
+                          title=f"{app.title} - ReDoc")
+
+
+# Root Endpoint
+# El cuerpo es constante y ya está serializado en HOME_BODY
+@app.get("/", response_model=Dict[str, str])
+async def home():
+    return Response(content=HOME_BODY, media_type="application/json")
+
+
+def match_window(needle: str, reverse: bool, start: int, stop: int) -> tuple:
+    # Una sola pasada sobre TITLES_LOWER (en orden de id): cuenta las
+    # coincidencias y guarda solo los ids que caen en la ventana [start, stop)
+    titles = reversed(TITLES_LOWER.items()) if reverse else TITLES_LOWER.items()
+    total = 0
+    window = []
+    for post_id, title in titles:
+        if needle in title:
+            if start <= total < stop:
+                window.append(post_id)
+            total += 1
+    return total, window
+
+
+# Las respuestas paginadas son deterministas entre mutaciones: se guardan en
+# caché ya serializadas, con DATA_VERSION en la llave para invalidarlas
+@lru_cache(maxsize=512)
+def _paginate(version: int, query: Optional[str], page: int, per_page: int,
+              order_by: str, direction: str) -> bytes:
     # ========== PASO 1: FILTRADO DE RESULTADOS ==========
-    # Inicializar con todos los posts disponibles
-    results = BLOG_POST
+    # Inicializar con todos los posts disponibles, ya ordenados por el campo pedido:
+    # - "id": el dict conserva el orden de insercion (id ascendente)
+    # - "title": TITLE_INDEX se mantiene ordenado por titulo
+    results = TITLE_INDEX if order_by == "title" else BLOG_POST.values()
 
     # Si se proporciona un parámetro de búsqueda (query), filtrar los posts
     # que contengan el término de búsqueda en el título (case-insensitive)
-    if query:
-        results = [post for post in BLOG_POST if query.lower()
-                   in post["title"].lower()]
+    # El término se pasa a minúsculas una sola vez y se compara contra
+    # TITLES_LOWER, que ya tiene los títulos en minúsculas
+    # No se arma la lista completa de coincidencias, solo los items de la página
+    needle = query.lower() if query else None
+    reverse = direction == "desc"
 
     # ========== PASO 2: CALCULAR TOTAL Y PÁGINAS ==========
     # Contar el total de resultados después del filtrado
-    total = len(results)
+    # - Búsqueda por id: match_window cuenta y toma los ids de la página pedida
+    #   en la misma pasada sobre TITLES_LOWER
+    # - Búsqueda por título: se cuentan las coincidencias sin guardarlas
+    window_ids = None
+    if needle and order_by == "id":
+        start = (page - 1) * per_page
+        total, window_ids = match_window(needle, reverse, start, start + per_page)
+    elif needle:
+        total = sum(1 for title in TITLES_LOWER.values() if needle in title)
+    else:
+        total = len(results)
 
-    # Calcular el total de páginas necesarias usando ceil (redondeo hacia arriba)
+    # Calcular el total de páginas necesarias redondeando hacia arriba con
+    # aritmética entera (sin pasar por float)
     # Ejemplos:
-    #   - total=29, per_page=10 → ceil(29/10) = ceil(2.9) = 3 páginas
-    #   - total=30, per_page=10 → ceil(30/10) = ceil(3.0) = 3 páginas
+    #   - total=29, per_page=10 → (29 + 9) // 10 = 38 // 10 = 3 páginas
+    #   - total=30, per_page=10 → (30 + 9) // 10 = 39 // 10 = 3 páginas
     #   - total=0, per_page=10 → 0 páginas (caso especial)
-    total_pages = ceil(total / per_page) if total > 0 else 0
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 0
 
     # ========== PASO 3: VALIDAR PÁGINA ACTUAL ==========
     # Si no hay resultados, establecer página actual en 1 (por defecto)
@@ -191,12 +386,16 @@ def get_posts(query: Optional[str] = Query(
         current_page = min(page, total_pages)
 
     # ========== PASO 4: ORDENAMIENTO ==========
-    # Ordenar los resultados según el campo especificado (order_by: "id" o "title")
-    # - key=lambda: define qué campo usar para ordenar
-    # - reverse=True si direction=="desc" (descendente: Z-A, 10-1)
-    # - reverse=False si direction=="asc" (ascendente: A-Z, 1-10)
-    results = sorted(
-        results, key=lambda post: post[order_by], reverse=direction == "desc")
+    # Los resultados ya vienen ordenados por el campo pedido (ver PASO 1),
+    # solo falta aplicar la dirección sin copiar ni reordenar nada
+    # - direction=="desc": se recorren al revés (descendente: Z-A, 10-1)
+    # - direction=="asc": se recorren tal cual (ascendente: A-Z, 1-10)
+    # Con búsqueda por título se filtra TITLE_INDEX con un generador para
+    # conservar el orden por título
+    ordered = reversed(results) if reverse else iter(results)
+    if needle and order_by == "title":
+        ordered = (post for post in ordered
+                   if needle in TITLES_LOWER[post["id"]])
 
     # ========== PASO 5: EXTRACCIÓN DE ITEMS DE LA PÁGINA ACTUAL ==========
     # Si no hay páginas (total_pages=0), devolver lista vacía
@@ -209,12 +408,18 @@ def get_posts(query: Optional[str] = Query(
         # Página 3: (3-1) * 10 = 20 → empieza en índice 20
         start = (current_page - 1) * per_page
 
-        # Extraer los items usando slicing
+        # Extraer solo los items de la página con islice
         # Ejemplos:
-        #   - Página 1, per_page=10 → results[0:10] (items 0-9)
-        #   - Página 2, per_page=10 → results[10:20] (items 10-19)
-        #   - Página 3, per_page=10 → results[20:30] (items 20-29)
-        items = results[start: start + per_page]
+        #   - Página 1, per_page=10 → items 0-9
+        #   - Página 2, per_page=10 → items 10-19
+        #   - Página 3, per_page=10 → items 20-29
+        if window_ids is None:
+            items = list(islice(ordered, start, start + per_page))
+        else:
+            if current_page != page:
+                # La página pedida no existía: tomar la ventana de la última
+                _, window_ids = match_window(needle, reverse, start, start + per_page)
+            items = [BLOG_POST[post_id] for post_id in window_ids]
 
     # ========== PASO 6: BANDERAS DE NAVEGACIÓN ==========
     # ¿Existe una página anterior?
@@ -227,8 +432,10 @@ def get_posts(query: Optional[str] = Query(
     has_next = current_page < total_pages
 
     # ========== PASO 7: RETORNAR RESPUESTA PAGINADA ==========
-    # Crear y retornar el objeto PaginatedPost con toda la metadata de paginación
-    return PaginatedPost(
+    # Crear el objeto PaginatedPost con toda la metadata de paginación
+    # model_construct no vuelve a validar: los valores ya son conocidos y solo
+    # los items (datos almacenados) pasan por POSTS_ADAPTER
+    page_data = PaginatedPost.model_construct(
         page=current_page,      # Número de página actual (validada)
         per_page=per_page,      # Cantidad de items por página
         # Total de items encontrados (después del filtrado)
@@ -239,77 +446,159 @@ def get_posts(query: Optional[str] = Query(
         order_by=order_by,      # Campo usado para ordenar ("id" o "title")
         direction=direction,    # Dirección del ordenamiento ("asc" o "desc")
         search=query,           # Término de búsqueda aplicado (si existe)
-        items=items             # Lista de posts de la página actual
+        # Lista de posts de la página actual
+        items=POSTS_ADAPTER.validate_python(items)
     )
+    # Se serializa una sola vez; response_model queda para la documentación
+    return PAGE_ADAPTER.dump_json(page_data)
+
+
+# Query Parameter
+# Define como quiero traer el recurso
+@app.get("/posts", response_model=PaginatedPost)
+async def get_posts(request: Request,
+                    query: Optional[str] = SEARCH_QUERY,
+                    per_page: int = PER_PAGE_QUERY,
+                    page: int = PAGE_QUERY,
+                    order_by: Literal["id", "title"] = ORDER_BY_QUERY,
+                    direction: Literal["asc", "desc"] = DIRECTION_QUERY):
+    etag = make_etag((query, page, per_page, order_by, direction))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    # La respuesta se arma (o se reutiliza de la caché) en _paginate
+    content = _paginate(DATA_VERSION, query, page, per_page, order_by, direction)
+    return Response(content=content, media_type="application/json",
+                    headers={"ETag": etag})
+
+
+def find_post(post_id: int, include_content: bool):
+    # Devuelve el post (o solo su resumen) o None si no existe
+    post = BLOG_POST.get(post_id)
+    if post is None or include_content:
+        return post
+    # Datos propios y ya validados: model_construct evita revalidarlos
+    return PostSummary.model_construct(id=post["id"], title=post["title"])
 
 
 # Path Parameter
 # Define como quiero traer un recurso especifico
 @app.get("/posts/{post_id}", response_model=Union[PostPublic, PostSummary], response_description="Blog post detail")
-def get_post(post_id: int = Path(
-    ...,
-    ge=1,
-    title="Post ID",
-    description="ID of the post to retrieve. Should be a positive integer.",
-), include_content: bool = Query(default=True, description="Incluir el contenido del post")):
-    for post in BLOG_POST:
-        if post["id"] == post_id:
-            if not include_content:
-                return PostSummary(id=post["id"], title=post["title"])
-            return post
-    raise HTTPException(status_code=404, detail="Post not found")
+async def get_post(request: Request, response: Response, post_id: int = POST_ID_PATH, include_content: bool = Query(default=True, description="Incluir el contenido del post")):
+    post = find_post(post_id, include_content)
+    if post is None:
+        return not_found()
+    etag = make_etag((post_id, include_content))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return post
 
 
 # Query parameter para filtrar si queremos incluir el contenido o no
-@app.get("/posts/{post_id}/detail")
-def get_post_detail(post_id: int, include_content: bool = Query(default=False, description="Incluir o no el contenido")):
-    for post in BLOG_POST:
-        if post["id"] == post_id:
-            if include_content:
-                return {"post": post}
-            return {"post": {"id": post["id"], "title": post["title"]}}
-    raise HTTPException(status_code=404, detail="Post not found")
+# Equivale a /posts/{post_id}; se mantiene la URL y solo se agrega el sobre {"post": ...}
+@app.get("/posts/{post_id}/detail", response_model=Dict[str, Any])
+async def get_post_detail(post_id: int, include_content: bool = Query(default=False, description="Incluir o no el contenido")):
+    post = find_post(post_id, include_content)
+    if post is None:
+        return not_found()
+    return {"post": post}
+
+
+def make_post(new_id: int, post: PostCreate) -> dict:
+    # Un solo model_dump convierte el post completo (incluidos los Tag) a dicts
+    return {"id": new_id, **post.model_dump(mode="python")}
 
 
 # POST
 # "..." elipsis, indica que es un campo obligatorio
 @app.post("/posts", response_model=PostPublic, response_description="Post created successfully", status_code=201)
-def create_post(post: PostCreate):
-    new_id = (BLOG_POST[-1]["id"] + 1) if BLOG_POST else 1
-    new_post = {"id": new_id,
-                "title": post.title,
-                "content": post.content,
-                # List comprehension to convert Tag models to dicts
-                "tags": [tag.model_dump() for tag in post.tags],
-                "author": post.author.model_dump() if post.author else None,
-                }
-
-    BLOG_POST.append(new_post)
+async def create_post(post: PostCreate):
+    global DATA_VERSION, NEXT_ID
+    new_id = NEXT_ID
+    NEXT_ID += 1
+    new_post = make_post(new_id, post)
+
+    BLOG_POST[new_id] = new_post
+    TITLES_LOWER[new_id] = post.title.lower()
+    index_title(new_post)
+    DATA_VERSION += 1
     return new_post
 
+
+# Endpoints por lote: N posts en un solo request en vez de N requests
+@app.post("/posts/bulk", response_model=List[PostPublic], response_description="Posts created successfully", status_code=201)
+async def bulk_create_posts(posts: List[PostCreate] = Body(..., max_length=MAX_BULK_SIZE)):
+    global DATA_VERSION, NEXT_ID
+    # Un lote vacío no cambia nada: no se invalidan cachés ni ETags
+    if not posts:
+        return []
+    first_id = NEXT_ID
+    NEXT_ID += len(posts)
+    # Los ids se asignan como un rango contiguo a partir del siguiente disponible
+    new_posts = [make_post(new_id, post)
+                 for new_id, post in enumerate(posts, start=first_id)]
+
+    BLOG_POST.update((new_post["id"], new_post) for new_post in new_posts)
+    TITLES_LOWER.update((new_post["id"], new_post["title"].lower())
+                        for new_post in new_posts)
+    # Timsort aprovecha que TITLE_INDEX ya está ordenado
+    TITLE_INDEX.extend(new_posts)
+    TITLE_INDEX.sort(key=_title_key)
+    DATA_VERSION += 1
+    return new_posts
+
+
+# Se declara antes de DELETE /posts/{post_id} para que "bulk" no se tome como un id
+@app.delete("/posts/bulk", status_code=204)
+async def bulk_delete_posts(ids: List[int] = Query(..., max_length=MAX_BULK_SIZE, description="IDs of the posts to delete")):
+    global DATA_VERSION
+    # Los ids que no existen se ignoran
+    id_set = {post_id for post_id in ids if post_id in BLOG_POST}
+    if not id_set:
+        return
+    for post_id in id_set:
+        del BLOG_POST[post_id]
+        del TITLES_LOWER[post_id]
+    # Se reconstruye el indice en una sola pasada en vez de borrar uno a uno
+    TITLE_INDEX[:] = [post for post in TITLE_INDEX if post["id"] not in id_set]
+    DATA_VERSION += 1
+
 # PUT
 
 
 @app.put("/posts/{post_id}", response_model=PostPublic, response_description="Post updated successfully", response_model_exclude_none=True, status_code=200)
-def update_post(post_id: int, updated_post: PostUpdate):
-    if post_id == "":
-        return {"error": "Post ID is required"}
-    for post in BLOG_POST:
-        if post["id"] == post_id:
-            playload = updated_post.model_dump(exclude_unset=True)
-            if "title" in playload:
-                post["title"] = playload["title"]
-            if "content" in playload:
-                post["content"] = playload["content"]
-            return post
-    raise HTTPException(status_code=404, detail="Post not found")
+async def update_post(post_id: int, updated_post: PostUpdate):
+    global DATA_VERSION
+    post = BLOG_POST.get(post_id)
+    if post is None:
+        return not_found()
+    playload = updated_post.model_dump(exclude_unset=True)
+    # Un titulo null dejaria el post sin titulo: se ignora (content si acepta null)
+    if "title" in playload and playload["title"] is None:
+        del playload["title"]
+    new_title = playload.get("title")
+    if new_title is not None:
+        # Todo lo que puede fallar se calcula antes de tocar los indices
+        new_title_lower = new_title.lower()
+        # Sacar el post del indice antes de modificar su titulo
+        unindex_title(post)
+    # Solo se aplican los campos enviados por el cliente
+    post.update(playload)
+    if new_title is not None:
+        # Asignar sobre la llave existente conserva el orden de TITLES_LOWER
+        TITLES_LOWER[post_id] = new_title_lower
+        index_title(post)
+    DATA_VERSION += 1
+    return post
 
 
 # DELETE
 @app.delete("/posts/{post_id}", status_code=204)
-def delete_post(post_id: int):
-    for index, post in enumerate(BLOG_POST):
-        if post["id"] == post_id:
-            del BLOG_POST[index]
-            return
-    raise HTTPException(status_code=404, detail="Post not found")
+async def delete_post(post_id: int):
+    global DATA_VERSION
+    post = BLOG_POST.pop(post_id, None)
+    if post is None:
+        return not_found()
+    del TITLES_LOWER[post_id]
+    unindex_title(post)
+    DATA_VERSION += 1